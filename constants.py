@@ -27,6 +27,9 @@ PERCENTAGE_TOLERANCE = 0.01
 # Settlement Configuration
 SETTLEMENT_TOLERANCE = 0.01  # 1 cent tolerance for settlement
 ROUNDING_PRECISION = 2  # Round to 2 decimal places for currency
+CENTS = 10**ROUNDING_PRECISION  # Minor currency units per major unit
+SETTLEMENT_TOLERANCE_CENTS = round(SETTLEMENT_TOLERANCE * CENTS)
+EXACT_SETTLEMENT_MAX_PEOPLE = 8  # Exhaustive transfer minimization up to this size
 
 # UI Configuration
 DEFAULT_CURRENCY_SYMBOL = "£"
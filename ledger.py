@@ -5,16 +5,68 @@ This module provides the main Ledger class that manages people and expenses,
 performs balance calculations, and handles debt settlement.
 """
 
-import re
+import heapq
+from collections import defaultdict
+from operator import attrgetter
 from models import Person, Expense
 from constants import (
     MAX_NAME_LENGTH,
-    NAME_PATTERN,
     MAX_AMOUNT,
     MAX_PEOPLE,
-    SETTLEMENT_TOLERANCE,
+    SETTLEMENT_TOLERANCE_CENTS,
+    EXACT_SETTLEMENT_MAX_PEOPLE,
     ROUNDING_PRECISION,
 )
+from utils import from_cents, canonical_name, has_valid_name_chars
+
+# Settlement line template, e.g. "Bob → Alice: 50.00£"
+_TRANSFER_TEMPLATE = f"%s → %s: %.{ROUNDING_PRECISION}f£"
+
+
+def _zero_sum_groups(balances: list[int]) -> list[list[int]]:
+    """
+    Partition balances into the largest possible number of zero-sum groups.
+
+    Uses a dynamic program over subsets: best[mask] is the most zero-sum
+    groups obtainable by removing the people in mask one at a time.
+    Runs in O(2^n * n), so it is only used for small n.
+
+    Args:
+        balances: Balance in cents for each person
+
+    Returns:
+        Groups of indices into balances. Every group sums to zero, except
+        that the first one also absorbs any overall imbalance.
+    """
+    full = (1 << len(balances)) - 1
+    totals = [0] * (full + 1)
+    best = [0] * (full + 1)
+    removed = [0] * (full + 1)
+
+    for mask in range(1, full + 1):
+        lowest = mask & -mask
+        totals[mask] = totals[mask ^ lowest] + balances[lowest.bit_length() - 1]
+
+        # Remove whichever person leaves the most zero-sum groups behind
+        best_count, best_bit, bit = -1, 0, lowest
+        while bit <= mask:
+            if mask & bit and best[mask ^ bit] > best_count:
+                best_count, best_bit = best[mask ^ bit], bit
+            bit <<= 1
+        best[mask] = best_count + (totals[mask] == 0)
+        removed[mask] = best_bit
+
+    # Walk the removal order back; a group closes whenever the rest sums to 0
+    groups, group, mask = [], [], full
+    while mask:
+        bit = removed[mask]
+        group.append(bit.bit_length() - 1)
+        mask ^= bit
+        if totals[mask] == 0:
+            groups.append(group)
+            group = []
+
+    return groups
 
 
 class Ledger:
@@ -27,6 +79,8 @@ class Ledger:
     Attributes:
         people (dict): Dictionary mapping names to Person objects
         expenses (list): List of Expense objects
+        total_balance (float): Total paid minus total owed across everyone
+        total_expenses (float): Sum of all recorded expense amounts
     """
 
     def __init__(self, people=None, expenses=None):
@@ -39,6 +93,34 @@ class Ledger:
         """
         self.people: dict[str, Person] = people if people is not None else {}
         self.expenses: list[Expense] = expenses if expenses is not None else []
+        # Pre-existing data has never been reconciled, so the first call to
+        # balances() must do a full recompute
+        self._dirty = bool(self.people or self.expenses)
+
+        # Running totals across all people, kept in step with every update
+        self._total_paid_cents = sum(p.paid_cents for p in self.people.values())
+        self._total_owe_cents = sum(p.owe_cents for p in self.people.values())
+        self._total_expense_cents = sum(e.amount_cents for e in self.expenses)
+
+    @property
+    def total_balance(self) -> float:
+        """
+        Get total paid minus total owed across everyone.
+
+        Maintained incrementally, so this is O(1). Once balances() has run
+        it is zero unless people were added with inconsistent preset amounts.
+        """
+        return from_cents(self._total_paid_cents - self._total_owe_cents)
+
+    @property
+    def total_expenses(self) -> float:
+        """
+        Get the sum of all recorded expense amounts.
+
+        Maintained incrementally by add_expense(), so summaries need not
+        rescan the expense list.
+        """
+        return from_cents(self._total_expense_cents)
 
     def add_person(
         self, name: str, balance: float = 0, paid: float = 0, owe: float = 0
@@ -59,24 +141,33 @@ class Ledger:
         if not isinstance(name, str):
             raise TypeError("Name must be a string")
 
-        name_clean = name.strip().lower()
+        name_clean = canonical_name(name)
         if not name_clean:
             raise ValueError("Name cannot be empty")
 
         if len(name_clean) > MAX_NAME_LENGTH:
             raise ValueError(f"Name too long (max {MAX_NAME_LENGTH} characters)")
 
-        if not re.match(NAME_PATTERN, name_clean):
+        if not has_valid_name_chars(name_clean):
             raise ValueError("Name contains invalid characters")
 
+        # Existing people are reported before the capacity check, since
+        # re-adding them does not grow the ledger
+        if self.people.get(name_clean) is not None:
+            print(f"Person {name_clean} already exists!")
+            return
+
         if len(self.people) >= MAX_PEOPLE:
             raise ValueError(f"Cannot add more people (max {MAX_PEOPLE})")
 
-        if name_clean in self.people:
-            print(f"Person {name_clean} already exists!")
-            return
+        person = Person(name_clean, balance, paid, owe)
+        self.people[name_clean] = person
+        self._total_paid_cents += person.paid_cents
+        self._total_owe_cents += person.owe_cents
 
-        self.people[name_clean] = Person(name_clean, balance, paid, owe)
+        # A preset owed amount is reset by the next full recompute
+        if owe:
+            self._dirty = True
 
     def add_expense(
         self, payer: str, amount: float, participants: list[str], split: str, **kwargs
@@ -115,8 +206,10 @@ class Ledger:
             raise ValueError(f"Amount cannot exceed {MAX_AMOUNT}£")
 
         # Clean names
-        payer_clean = payer.strip().lower()
-        participants_clean = [p.strip().lower() for p in participants if p.strip()]
+        payer_clean = canonical_name(payer)
+        participants_clean = [
+            name for name in map(canonical_name, participants) if name
+        ]
 
         if not participants_clean:
             raise ValueError("No valid participants after cleaning names")
@@ -146,83 +239,162 @@ class Ledger:
                         f"Person {participant.capitalize()} does not exist. Create them first."
                     )
 
-        # Create and add expense
+        # Create the expense and compute its shares up front so invalid split
+        # parameters are rejected before anything is recorded
         expense = Expense(payer_clean, amount, participants_clean, split, **kwargs)
+        shares = expense.shares
+
         self.expenses.append(expense)
-        self.people[expense.payer].paid += expense.amount
+        self.people[expense.payer].paid_cents += expense.amount_cents
+        self._total_paid_cents += expense.amount_cents
+        self._total_expense_cents += expense.amount_cents
+
+        # Keep owed totals current so balances() does not rescan every expense
+        if not self._dirty:
+            for participant, share in shares.items():
+                self.people[participant].owe_cents += share
+            self._total_owe_cents += sum(shares.values())
+
+    def invalidate(self) -> None:
+        """
+        Mark the incrementally maintained owed amounts as stale.
+
+        Call this after editing recorded expenses or people in place; the
+        next balances() call then recomputes everything from the expenses.
+        """
+        self._dirty = True
 
     def balances(self) -> None:
         """
         Calculate and update each person's balance based on expenses.
 
-        Resets all owe amounts and recalculates them based on current expenses.
-        Balance = paid - owed for each person.
+        Owed amounts are maintained incrementally by add_expense(), so a full
+        recompute from every expense only happens when the ledger is dirty
+        (pre-existing data or preset owed amounts). Expenses edited in place
+        after being added are not tracked; call invalidate() to force a rescan.
+        Balance = paid - owed for each person, computed exactly in cents.
         """
-        # Reset owe amounts for all people
-        for person in self.people.values():
-            person.owe = 0
+        if self._dirty:
+            # Accumulate owed cents into plain ints first, then write each
+            # person's total once instead of updating attributes per share
+            owed = dict.fromkeys(self.people, 0)
+            for expense in self.expenses:
+                for participant, share in expense.shares.items():
+                    owed[participant] += share
 
-        # Calculate owed amounts from expenses
-        for expense in self.expenses:
-            shares = expense.split.compute_shares(expense.amount, expense.participants)
-            for participant, share in shares.items():
-                self.people[participant].owe += share
+            for name, person in self.people.items():
+                person.owe_cents = owed[name]
+
+            self._total_owe_cents = sum(owed.values())
+            self._dirty = False
 
         # Update balance for each person
         for person in self.people.values():
-            person.balance = round(person.paid - person.owe, ROUNDING_PRECISION)
+            person.balance_cents = person.paid_cents - person.owe_cents
 
     def settle(self) -> None:
         """
         Generate and print optimal debt settlement transactions.
 
-        Uses a greedy algorithm to minimize the number of transactions
-        needed to settle all debts. Matches the largest creditor with
-        the largest debtor iteratively.
+        People with exactly opposite balances are paired off first in a
+        single hashed pass, one transfer per pair. For small ledgers, the
+        rest are then partitioned into the largest number of zero-sum
+        groups, since a group of k people settles in k - 1 transfers and
+        fewer, larger groups never need fewer. Each group is then settled
+        greedily, matching the largest creditor with the largest debtor
+        iteratively.
         """
-        # Separate creditors (positive balance) and debtors (negative balance)
-        creditors = {p.name: p for p in self.people.values() if p.balance > 0}
-        debtors = {p.name: p for p in self.people.values() if p.balance < 0}
-
-        # Continue until all significant balances are settled
-        while (
-            creditors
-            and debtors
-            and max(p.balance for p in creditors.values()) > SETTLEMENT_TOLERANCE
-        ):
-            # Find the person owed the most and person who owes the most
-            max_creditor = max(creditors.values(), key=lambda p: p.balance)
-            max_debtor = min(debtors.values(), key=lambda p: p.balance)
-
-            # Calculate transfer amount (limited by smaller of the two balances)
-            transfer_amount = round(
-                min(max_creditor.balance, abs(max_debtor.balance)), ROUNDING_PRECISION
-            )
+        transactions: list[str] = []
 
-            # Print the transaction
-            print(
-                f"{max_debtor.name.capitalize()} → {max_creditor.name.capitalize()}: "
-                f"{transfer_amount:.{ROUNDING_PRECISION}f}£"
-            )
+        # Pair off creditors and debtors whose balances exactly cancel
+        debtors_by_amount = defaultdict(list)
+        for person in self.people.values():
+            if person.balance_cents < -SETTLEMENT_TOLERANCE_CENTS:
+                debtors_by_amount[-person.balance_cents].append(person)
+        for person in self.people.values():
+            matches = debtors_by_amount.get(person.balance_cents)
+            if matches:
+                self._transfer(
+                    matches.pop(), person, person.balance_cents, transactions
+                )
 
-            # Update balances
-            max_creditor.balance = round(
-                max_creditor.balance - transfer_amount, ROUNDING_PRECISION
-            )
-            max_debtor.balance = round(
-                max_debtor.balance + transfer_amount, ROUNDING_PRECISION
-            )
+        people = [p for p in self.people.values() if p.balance_cents]
+        if len(people) <= EXACT_SETTLEMENT_MAX_PEOPLE:
+            groups = [
+                [people[i] for i in group]
+                for group in _zero_sum_groups([p.balance_cents for p in people])
+            ]
+        else:
+            groups = [people]
 
-            # Remove people with negligible balances
-            if abs(max_creditor.balance) <= SETTLEMENT_TOLERANCE:
-                del creditors[max_creditor.name]
-            if abs(max_debtor.balance) <= SETTLEMENT_TOLERANCE:
-                del debtors[max_debtor.name]
+        for group in groups:
+            self._settle_group(group, transactions)
 
-        # Clean up any remaining small balances due to rounding
+        # Clean up any remaining sub-tolerance balances
         for person in self.people.values():
-            if abs(person.balance) <= SETTLEMENT_TOLERANCE:
-                person.balance = 0.0
+            if abs(person.balance_cents) <= SETTLEMENT_TOLERANCE_CENTS:
+                person.balance_cents = 0
+
+        # Print all transactions in a single write
+        if transactions:
+            print("\n".join(transactions))
+
+    def _settle_group(self, group: list[Person], transactions: list[str]) -> None:
+        """
+        Greedily settle a group of people, recording each transfer.
+
+        Creditors and debtors are kept in heaps so each match of the
+        largest creditor with the largest debtor costs O(log n).
+
+        Args:
+            group: People to settle among themselves
+            transactions: List that formatted transfer lines are appended to
+        """
+        # Max-heap of creditors (negated balance) and min-heap of debtors
+        creditors = [(-p.balance_cents, p.name) for p in group if p.balance_cents > 0]
+        debtors = [(p.balance_cents, p.name) for p in group if p.balance_cents < 0]
+        heapq.heapify(creditors)
+        heapq.heapify(debtors)
+
+        # Continue until all significant balances are settled
+        while creditors and debtors and -creditors[0][0] > SETTLEMENT_TOLERANCE_CENTS:
+            # Take the person owed the most and the person who owes the most
+            max_creditor = self.people[heapq.heappop(creditors)[1]]
+            max_debtor = self.people[heapq.heappop(debtors)[1]]
+
+            # Transfer amount is limited by the smaller of the two balances
+            transfer_cents = min(max_creditor.balance_cents, -max_debtor.balance_cents)
+            self._transfer(max_debtor, max_creditor, transfer_cents, transactions)
+
+            # Push back anyone with a significant residual balance
+            if abs(max_creditor.balance_cents) > SETTLEMENT_TOLERANCE_CENTS:
+                heapq.heappush(
+                    creditors, (-max_creditor.balance_cents, max_creditor.name)
+                )
+            if abs(max_debtor.balance_cents) > SETTLEMENT_TOLERANCE_CENTS:
+                heapq.heappush(debtors, (max_debtor.balance_cents, max_debtor.name))
+
+    @staticmethod
+    def _transfer(
+        debtor: Person, creditor: Person, amount_cents: int, transactions: list[str]
+    ) -> None:
+        """
+        Move money from a debtor to a creditor and record the transaction.
+
+        Args:
+            debtor: Person paying
+            creditor: Person being paid
+            amount_cents: Amount transferred, in cents
+            transactions: List that the formatted transfer line is appended to
+        """
+        transactions.append(
+            _TRANSFER_TEMPLATE
+            % (debtor.display_name, creditor.display_name, from_cents(amount_cents))
+        )
+
+        # Update balances (exact integer arithmetic, no rounding needed)
+        creditor.balance_cents -= amount_cents
+        debtor.balance_cents += amount_cents
 
     def list_expenses(self) -> None:
         """Print all expenses in the ledger."""
@@ -239,8 +411,8 @@ class Ledger:
             print("No people in ledger.")
             return
 
-        sorted_people = sorted(
-            self.people.values(), key=lambda p: p.balance, reverse=True
+        sorted_people = heapq.nlargest(
+            len(self.people), self.people.values(), key=attrgetter("balance_cents")
         )
         people_str = "\n".join(str(person) for person in sorted_people)
         print(f"People:\n{people_str}")
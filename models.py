@@ -1,16 +1,21 @@
 """
 Data models for the Expense Splitting Calculator application.
 
-This module defines the core data structures: Person and Expense classes,
-along with validation functions for monetary values.
+This module defines the core data structures: Person and Expense classes.
 """
 
-import re
+from typing import Optional
 import inflect
 from split_strategies import EqualSplit, WeightsSplit, PercentSplit, ExactSplit, Split
+from utils import (
+    to_cents,
+    from_cents,
+    canonical_name,
+    has_valid_name_chars,
+    is_valid_money,
+)
 from constants import (
     MAX_NAME_LENGTH,
-    NAME_PATTERN,
     MAX_AMOUNT,
     MAX_PARTICIPANTS,
     ROUNDING_PRECISION,
@@ -20,43 +25,26 @@ from constants import (
 p = inflect.engine()
 
 
-def is_valid_money(value) -> bool:
-    """
-    Check if a value represents a valid monetary amount.
-
-    Args:
-        value: Value to validate (any type)
-
-    Returns:
-        True if valid monetary amount, False otherwise
-    """
-    if not isinstance(value, (int, float)):
-        return False
-
-    # Check for infinite values and NaN
-    if not (float("-inf") < value < float("inf")) or value != value:
-        return False
-
-    # Validate decimal places precision
-    value_str = f"{value:.10f}".rstrip("0").rstrip(".")
-    if "." in value_str:
-        decimals = value_str.split(".")[1]
-        return len(decimals) <= ROUNDING_PRECISION
-
-    return True
-
-
 class Person:
     """
     Represents a person in the expense ledger.
 
+    Monetary state is stored as whole cents; the float attributes are
+    views over the ``*_cents`` integers.
+
     Attributes:
         name (str): Person's name (cleaned and normalized)
+        display_name (str): Capitalized name for output
         balance (float): Current balance (paid - owed)
         paid (float): Total amount paid by this person
         owe (float): Total amount owed by this person
+        balance_cents (int): Current balance in cents
+        paid_cents (int): Total amount paid in cents
+        owe_cents (int): Total amount owed in cents
     """
 
+    __slots__ = ("_name", "display_name", "balance_cents", "paid_cents", "owe_cents")
+
     def __init__(self, name: str, balance: float = 0, paid: float = 0, owe: float = 0):
         """
         Initialize a Person instance.
@@ -90,28 +78,51 @@ class Person:
             raise ValueError("Name cannot be empty or whitespace only")
         if len(cleaned_name) > MAX_NAME_LENGTH:
             raise ValueError(f"Name too long (max {MAX_NAME_LENGTH} characters)")
-        if not re.match(NAME_PATTERN, cleaned_name):
+        if not has_valid_name_chars(cleaned_name):
             raise ValueError(
                 "Name contains invalid characters (use letters, numbers, spaces, hyphens, underscores, dots)"
             )
 
-        self._name = cleaned_name.lower()
+        self._name = canonical_name(cleaned_name)
+        self.display_name = self._name.capitalize()
 
     @property
     def balance(self) -> float:
         """Get the person's balance."""
-        return self._balance
+        return from_cents(self.balance_cents)
 
     @balance.setter
     def balance(self, balance: float) -> None:
         """Set and validate the person's balance."""
         if not is_valid_money(balance):
             raise ValueError("Balance not valid monetary amount")
-        self._balance = balance
+        self.balance_cents = to_cents(balance)
+
+    @property
+    def paid(self) -> float:
+        """Get the total amount paid by the person."""
+        return from_cents(self.paid_cents)
+
+    @paid.setter
+    def paid(self, paid: float) -> None:
+        """Set the total amount paid, rounded to the nearest cent."""
+        self.paid_cents = to_cents(paid)
+
+    @property
+    def owe(self) -> float:
+        """Get the total amount owed by the person."""
+        return from_cents(self.owe_cents)
+
+    @owe.setter
+    def owe(self, owe: float) -> None:
+        """Set the total amount owed, rounded to the nearest cent."""
+        self.owe_cents = to_cents(owe)
 
     def __str__(self) -> str:
         """Return a string representation of the person."""
-        return f"{self.name.capitalize()} with balance: {self.balance:.{ROUNDING_PRECISION}f}£"
+        return (
+            f"{self.display_name} with balance: {self.balance:.{ROUNDING_PRECISION}f}£"
+        )
 
 
 class Expense:
@@ -123,8 +134,21 @@ class Expense:
         amount (float): Expense amount
         participants (list[str]): List of people involved in the expense
         split (Split): Strategy object for splitting the expense
+        shares (dict): Cached share in cents for each participant
     """
 
+    __slots__ = (
+        "_payer",
+        "_amount_cents",
+        "_participants",
+        "_split",
+        "_shares",
+        "_shares_version",
+    )
+
+    _shares: Optional[dict[str, int]]
+    _shares_version: int
+
     def __init__(
         self, payer: str, amount: float, participants: list[str], split: str, **kwargs
     ):
@@ -172,7 +196,7 @@ class Expense:
     @property
     def amount(self) -> float:
         """Get the expense amount."""
-        return self._amount
+        return from_cents(self._amount_cents)
 
     @amount.setter
     def amount(self, amount: float) -> None:
@@ -183,7 +207,13 @@ class Expense:
             raise ValueError("Expense must be positive")
         if amount > MAX_AMOUNT:
             raise ValueError(f"Expense cannot exceed {MAX_AMOUNT}£")
-        self._amount = round(amount, ROUNDING_PRECISION)
+        self._amount_cents = to_cents(amount)
+        self._shares = None
+
+    @property
+    def amount_cents(self) -> int:
+        """Get the expense amount in cents."""
+        return self._amount_cents
 
     @property
     def participants(self) -> list[str]:
@@ -206,14 +236,14 @@ class Expense:
             if not isinstance(participant, str):
                 raise TypeError("All participant names must be strings")
 
-            clean_name = participant.strip().lower()
+            clean_name = canonical_name(participant)
             if not clean_name:
                 raise ValueError("Participant names cannot be empty")
             if len(clean_name) > MAX_NAME_LENGTH:
                 raise ValueError(
                     f"Participant name too long (max {MAX_NAME_LENGTH} characters)"
                 )
-            if not re.match(NAME_PATTERN, clean_name):
+            if not has_valid_name_chars(clean_name):
                 raise ValueError("Participant name contains invalid characters")
 
             clean_participants.append(clean_name)
@@ -222,6 +252,7 @@ class Expense:
             raise ValueError("Duplicate participants found")
 
         self._participants = clean_participants
+        self._shares = None
 
     @property
     def split(self) -> Split:
@@ -234,6 +265,23 @@ class Expense:
         if not isinstance(split, (EqualSplit, WeightsSplit, PercentSplit, ExactSplit)):
             raise ValueError("Split method not valid")
         self._split = split
+        self._shares = None
+
+    @property
+    def shares(self) -> dict[str, int]:
+        """
+        Get each participant's share in cents.
+
+        Computed on first access and cached until the amount, participants
+        or split strategy is reassigned, or the split's own parameters are
+        (tracked through the split's version).
+        """
+        if self._shares is None or self._shares_version != self.split.version:
+            self._shares = self.split.compute_cents(
+                self.amount_cents, self.participants
+            )
+            self._shares_version = self.split.version
+        return self._shares
 
     def __str__(self) -> str:
         """Return a string representation of the expense."""
@@ -172,8 +172,8 @@ def get_participants_interactive(ledger):
 
     print("\nAvailable people:")
     people_list = list(ledger.people.keys())
-    for i, person in enumerate(people_list, 1):
-        print(f"  {i}. {person.capitalize()}")
+    for i, person in enumerate(ledger.people.values(), 1):
+        print(f"  {i}. {person.display_name}")
 
     print(
         "\nSelect participants (enter numbers separated by commas, or 'all' for everyone):"
@@ -355,8 +355,8 @@ def add_expense_interactive(ledger):
         # Get payer
         print("\nWho paid for this expense?")
         people_list = list(ledger.people.keys())
-        for i, person in enumerate(people_list, 1):
-            print(f"  {i}. {person.capitalize()}")
+        for i, person in enumerate(ledger.people.values(), 1):
+            print(f"  {i}. {person.display_name}")
 
         while True:
             try:
@@ -401,8 +401,8 @@ def view_people(ledger):
     if not ledger.people:
         print("No people added yet.")
     else:
-        for i, (name, person) in enumerate(ledger.people.items(), 1):
-            print(f"{i}. {name.capitalize()}")
+        for i, person in enumerate(ledger.people.values(), 1):
+            print(f"{i}. {person.display_name}")
 
     input("\nPress Enter to continue...")
 
@@ -438,7 +438,7 @@ def show_summary(ledger):
     print(f"🧾 Expenses: {len(ledger.expenses)}")
 
     if ledger.expenses:
-        total_expenses = sum(expense.amount for expense in ledger.expenses)
+        total_expenses = ledger.total_expenses
         print(f"💰 Total amount: {format_currency(total_expenses)}")
         print(
             f"📈 Average expense: {format_currency(total_expenses / len(ledger.expenses))}"
@@ -446,20 +446,26 @@ def show_summary(ledger):
 
         ledger.balances()  # Calculate current balances
 
-        creditors = [p for p in ledger.people.values() if p.balance > 0]
-        debtors = [p for p in ledger.people.values() if p.balance < 0]
-
-        if creditors:
-            max_creditor = max(creditors, key=lambda p: p.balance)
+        # Find the biggest creditor and debtor in a single pass
+        max_creditor = max_debtor = None
+        for person in ledger.people.values():
+            cents = person.balance_cents
+            if cents > 0:
+                if max_creditor is None or cents > max_creditor.balance_cents:
+                    max_creditor = person
+            elif cents < 0:
+                if max_debtor is None or cents < max_debtor.balance_cents:
+                    max_debtor = person
+
+        if max_creditor is not None:
             print(
-                f"🏆 Biggest creditor: {max_creditor.name.capitalize()} "
+                f"🏆 Biggest creditor: {max_creditor.display_name} "
                 f"({format_currency(max_creditor.balance)})"
             )
 
-        if debtors:
-            max_debtor = min(debtors, key=lambda p: p.balance)
+        if max_debtor is not None:
             print(
-                f"💸 Biggest debtor: {max_debtor.name.capitalize()} "
+                f"💸 Biggest debtor: {max_debtor.display_name} "
                 f"({format_currency(abs(max_debtor.balance))})"
             )
 
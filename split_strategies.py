@@ -5,12 +5,16 @@ This module implements different algorithms for splitting expenses among
 participants using the Strategy pattern.
 """
 
+import math
+from types import MappingProxyType
+from typing import Mapping, Optional
 from constants import (
     MIN_PERCENTAGE,
     MAX_PERCENTAGE,
     PERCENTAGE_TOLERANCE,
     ROUNDING_PRECISION,
 )
+from utils import from_cents, canonical_name
 
 
 class Split:
@@ -18,12 +22,21 @@ class Split:
     Abstract base class for expense split strategies.
 
     All split strategies must implement the compute_shares method
-    to define how expenses are divided among participants.
+    to define how expenses are divided among participants. Strategies with
+    parameters bump ``version`` whenever they are reassigned, so cached
+    shares can tell when they are stale.
     """
 
+    _version = 0
+
+    @property
+    def version(self) -> int:
+        """Get a counter that changes whenever the split parameters change."""
+        return self._version
+
     def compute_shares(
         self, amount: float, participants: list[str], *args, **kwargs
-    ) -> dict:
+    ) -> dict[str, float]:
         """
         Compute the share for each participant.
 
@@ -40,6 +53,46 @@ class Split:
         """
         raise NotImplementedError("Subclasses must implement compute_shares")
 
+    def compute_cents(
+        self, amount_cents: int, participants: list[str]
+    ) -> dict[str, int]:
+        """
+        Compute the share for each participant in whole cents.
+
+        Shares from compute_shares() are scaled so they add up to the total in
+        cents (percentages may sum to 100 only within PERCENTAGE_TOLERANCE)
+        and rounded down, then the leftover cents go to the largest
+        fractional parts so the shares always sum exactly to the total.
+
+        Args:
+            amount_cents: Total amount to split, in cents
+            participants: List of participant names
+
+        Returns:
+            Dictionary mapping participant name to their share in cents
+        """
+        shares = self.compute_shares(from_cents(amount_cents), participants)
+        total_share = sum(shares[participant] for participant in participants)
+        if not total_share:
+            return dict.fromkeys(participants, 0)
+
+        # Cents per unit of share, normalising away any tolerance in the total
+        cents_per_share = amount_cents / total_share
+        cents = {}
+        fractions = {}
+        for participant in participants:
+            scaled = shares[participant] * cents_per_share
+            cents[participant] = whole = math.floor(scaled)
+            fractions[participant] = scaled - whole
+
+        # Hand out the leftover cents by largest fractional part (stable order)
+        remainder = amount_cents - sum(cents.values())
+        by_fraction = sorted(participants, key=fractions.__getitem__, reverse=True)
+        for participant in by_fraction[:remainder]:
+            cents[participant] += 1
+
+        return cents
+
 
 class EqualSplit(Split):
     """
@@ -48,7 +101,9 @@ class EqualSplit(Split):
     The simplest splitting method where each participant pays the same amount.
     """
 
-    def compute_shares(self, amount: float, participants: list[str]) -> dict:
+    def compute_shares(
+        self, amount: float, participants: list[str]
+    ) -> dict[str, float]:
         """
         Compute equal shares for each participant.
 
@@ -60,7 +115,29 @@ class EqualSplit(Split):
             Dictionary with equal shares for each participant
         """
         share_per_person = amount / len(participants)
-        return {participant: share_per_person for participant in participants}
+        return dict.fromkeys(participants, share_per_person)
+
+    def compute_cents(
+        self, amount_cents: int, participants: list[str]
+    ) -> dict[str, int]:
+        """
+        Compute equal shares in whole cents.
+
+        Any cents left over by the integer division go one each to the
+        first participants, so the shares sum exactly to the total.
+
+        Args:
+            amount_cents: Total amount to split, in cents
+            participants: List of participant names
+
+        Returns:
+            Dictionary with each participant's share in cents
+        """
+        share, remainder = divmod(amount_cents, len(participants))
+        shares = dict.fromkeys(participants, share)
+        for participant in participants[:remainder]:
+            shares[participant] += 1
+        return shares
 
     def __str__(self) -> str:
         return "Equal split"
@@ -71,42 +148,60 @@ class WeightsSplit(Split):
     Split strategy that divides the amount proportionally based on weights.
 
     Participants with higher weights pay a larger share of the expense.
+    Weights are validated once when assigned; compute_shares() then only
+    checks that they cover the participants. The weights are copied and
+    exposed read-only, so change them by assigning a new dictionary.
     """
 
-    def __init__(self, weights=None):
+    _weights_clean: dict[str, float]
+    _total_weight: float
+
+    def __init__(self, weights: Optional[dict[str, float]] = None) -> None:
         """
         Initialize with optional weights dictionary.
 
         Args:
             weights: Dictionary mapping participant names to their weights
+
+        Raises:
+            ValueError: If weights are negative or all zero
+            TypeError: If weight values are not numeric
         """
         self.weights = weights or {}
 
-    def compute_shares(
-        self, amount: float, participants: list[str], weights=None
-    ) -> dict:
+    @property
+    def weights(self) -> Mapping[str, float]:
+        """Get a read-only view of the weights."""
+        return MappingProxyType(self._weights)
+
+    @weights.setter
+    def weights(self, weights: dict[str, float]) -> None:
+        """Set and validate the weights, caching their cleaned form and total."""
+        self._weights_clean, self._total_weight = (
+            self._validate_weights(weights) if weights else ({}, 0)
+        )
+        self._weights = dict(weights)
+        self._version += 1
+
+    @staticmethod
+    def _validate_weights(weights: dict[str, float]) -> tuple[dict[str, float], float]:
         """
-        Compute proportional shares based on weights.
+        Clean weight keys and validate the weight values.
 
         Args:
-            amount: Total amount to split
-            participants: List of participant names
-            weights: Optional weights dictionary (overrides instance weights)
+            weights: Dictionary mapping participant names to their weights
 
         Returns:
-            Dictionary with weighted shares for each participant
+            Tuple of (cleaned weights dictionary, total weight)
 
         Raises:
-            ValueError: If weights are invalid or missing
+            ValueError: If weights are negative or all zero
             TypeError: If weight values are not numeric
         """
-        weights = weights if weights is not None else self.weights
-
-        if not weights:
-            raise ValueError("Weights dictionary cannot be empty")
-
         # Clean and normalize weight keys
-        weights_clean = {name.strip().lower(): weights[name] for name in weights.keys()}
+        weights_clean = {
+            canonical_name(name): weight for name, weight in weights.items()
+        }
 
         # Validate weight values
         for participant, weight in weights_clean.items():
@@ -115,10 +210,51 @@ class WeightsSplit(Split):
             if weight < 0:
                 raise ValueError(f"Weight for {participant} cannot be negative")
 
+        # Calculate total weight and validate it's positive
+        total_weight = sum(weights_clean.values())
+        if total_weight == 0:
+            raise ValueError(
+                "Total weight must be greater than zero. All weights cannot be zero."
+            )
+
+        return weights_clean, total_weight
+
+    def compute_shares(
+        self,
+        amount: float,
+        participants: list[str],
+        weights: Optional[dict[str, float]] = None,
+    ) -> dict[str, float]:
+        """
+        Compute proportional shares based on weights.
+
+        Args:
+            amount: Total amount to split
+            participants: List of participant names
+            weights: Optional weights dictionary (overrides instance weights)
+
+        Returns:
+            Dictionary with weighted shares for each participant
+
+        Raises:
+            ValueError: If weights are invalid or missing
+            TypeError: If weight values are not numeric
+        """
+        if weights is None:
+            weights_clean, total_weight = self._weights_clean, self._total_weight
+        elif weights:
+            weights_clean, total_weight = self._validate_weights(weights)
+        else:
+            weights_clean = {}
+
+        if not weights_clean:
+            raise ValueError("Weights dictionary cannot be empty")
+
         # Check that all participants have weights
-        if set(weights_clean.keys()) != set(participants):
-            missing = set(participants) - set(weights_clean.keys())
-            extra = set(weights_clean.keys()) - set(participants)
+        participant_set = set(participants)
+        if weights_clean.keys() != participant_set:
+            missing = participant_set - weights_clean.keys()
+            extra = weights_clean.keys() - participant_set
             error_msg = "Weights must be provided for all participants."
             if missing:
                 error_msg += f" Missing weights for: {', '.join(missing)}"
@@ -126,16 +262,10 @@ class WeightsSplit(Split):
                 error_msg += f" Extra weights for: {', '.join(extra)}"
             raise ValueError(error_msg)
 
-        # Calculate total weight and validate it's positive
-        total_weight = sum(weights_clean[p] for p in participants)
-        if total_weight == 0:
-            raise ValueError(
-                "Total weight must be greater than zero. All weights cannot be zero."
-            )
-
-        # Compute proportional shares
+        # Compute proportional shares with one multiply per participant
+        per_unit = amount / total_weight
         return {
-            participant: amount * weights_clean[participant] / total_weight
+            participant: weights_clean[participant] * per_unit
             for participant in participants
         }
 
@@ -148,44 +278,57 @@ class PercentSplit(Split):
     Split strategy that divides the amount according to percentages.
 
     Percentages must sum to 100%. Each participant pays their specified
-    percentage of the total expense.
+    percentage of the total expense. Percentages are validated once when
+    assigned; compute_shares() then only checks that they cover the
+    participants. The percentages are copied and exposed read-only, so
+    change them by assigning a new dictionary.
     """
 
-    def __init__(self, percentages=None):
+    def __init__(self, percentages: Optional[dict[str, float]] = None) -> None:
         """
         Initialize with optional percentages dictionary.
 
         Args:
             percentages: Dictionary mapping participant names to percentages (0-100)
+
+        Raises:
+            ValueError: If percentages are out of range or don't sum to 100%
+            TypeError: If percentage values are not numeric
         """
         self.percentages = percentages or {}
 
-    def compute_shares(
-        self, amount: float, participants: list[str], percentages=None
-    ) -> dict:
+    @property
+    def percentages(self) -> Mapping[str, float]:
+        """Get a read-only view of the percentages."""
+        return MappingProxyType(self._percentages)
+
+    @percentages.setter
+    def percentages(self, percentages: dict[str, float]) -> None:
+        """Set and validate the percentages, caching their cleaned form."""
+        self._percentages_clean = (
+            self._validate_percentages(percentages) if percentages else {}
+        )
+        self._percentages = dict(percentages)
+        self._version += 1
+
+    @staticmethod
+    def _validate_percentages(percentages: dict[str, float]) -> dict[str, float]:
         """
-        Compute shares based on percentages that must sum to 100%.
+        Clean percentage keys and validate the percentage values.
 
         Args:
-            amount: Total amount to split
-            participants: List of participant names
-            percentages: Optional percentages dictionary (overrides instance percentages)
+            percentages: Dictionary mapping participant names to percentages
 
         Returns:
-            Dictionary with percentage-based shares for each participant
+            Cleaned percentages dictionary
 
         Raises:
-            ValueError: If percentages are invalid, missing, or don't sum to 100%
+            ValueError: If percentages are out of range or don't sum to 100%
             TypeError: If percentage values are not numeric
         """
-        percentages = percentages if percentages is not None else self.percentages
-
-        if not percentages:
-            raise ValueError("Percentages dictionary cannot be empty")
-
         # Clean and normalize percentage keys
         percentages_clean = {
-            name.strip().lower(): percentages[name] for name in percentages.keys()
+            canonical_name(name): percentage for name, percentage in percentages.items()
         }
 
         # Validate percentage values
@@ -201,17 +344,50 @@ class PercentSplit(Split):
                     f"Percentage for {participant} cannot exceed {MAX_PERCENTAGE}%"
                 )
 
-        # Check that all participants have percentages
-        if set(percentages_clean) != set(participants):
-            raise ValueError("Percentages must be provided for all participants.")
-
         # Validate percentages sum to 100%
-        total_percent = sum(percentages_clean[p] for p in participants)
+        total_percent = sum(percentages_clean.values())
         if abs(total_percent - 100.0) > PERCENTAGE_TOLERANCE:
             raise ValueError(
                 f"Percentages must sum to 100% (currently {total_percent:.2f}%)"
             )
 
+        return percentages_clean
+
+    def compute_shares(
+        self,
+        amount: float,
+        participants: list[str],
+        percentages: Optional[dict[str, float]] = None,
+    ) -> dict[str, float]:
+        """
+        Compute shares based on percentages that must sum to 100%.
+
+        Args:
+            amount: Total amount to split
+            participants: List of participant names
+            percentages: Optional percentages dictionary (overrides instance percentages)
+
+        Returns:
+            Dictionary with percentage-based shares for each participant
+
+        Raises:
+            ValueError: If percentages are invalid, missing, or don't sum to 100%
+            TypeError: If percentage values are not numeric
+        """
+        if percentages is None:
+            percentages_clean = self._percentages_clean
+        elif percentages:
+            percentages_clean = self._validate_percentages(percentages)
+        else:
+            percentages_clean = {}
+
+        if not percentages_clean:
+            raise ValueError("Percentages dictionary cannot be empty")
+
+        # Check that all participants have percentages
+        if percentages_clean.keys() != set(participants):
+            raise ValueError("Percentages must be provided for all participants.")
+
         # Compute percentage-based shares
         return {
             participant: amount * percentages_clean[participant] / 100
@@ -228,9 +404,15 @@ class ExactSplit(Split):
 
     The specified amounts must sum exactly to the total expense amount.
     This provides precise control over how much each participant pays.
+    The cleaned amounts and their sum are cached when assigned; the amounts
+    are copied and exposed read-only, so change them by assigning a new
+    dictionary.
     """
 
-    def __init__(self, exact_amounts=None):
+    _exact_amounts_clean: dict[str, float]
+    _exact_total: float
+
+    def __init__(self, exact_amounts: Optional[dict[str, float]] = None) -> None:
         """
         Initialize with optional exact amounts dictionary.
 
@@ -239,9 +421,45 @@ class ExactSplit(Split):
         """
         self.exact_amounts = exact_amounts or {}
 
+    @property
+    def exact_amounts(self) -> Mapping[str, float]:
+        """Get a read-only view of the exact amounts."""
+        return MappingProxyType(self._exact_amounts)
+
+    @exact_amounts.setter
+    def exact_amounts(self, exact_amounts: dict[str, float]) -> None:
+        """Set the exact amounts, caching their cleaned form and sum."""
+        self._exact_amounts_clean, self._exact_total = (
+            self._clean_exact_amounts(exact_amounts) if exact_amounts else ({}, 0)
+        )
+        self._exact_amounts = dict(exact_amounts)
+        self._version += 1
+
+    @staticmethod
+    def _clean_exact_amounts(
+        exact_amounts: dict[str, float],
+    ) -> tuple[dict[str, float], float]:
+        """
+        Clean exact amount keys and sum the amounts.
+
+        Args:
+            exact_amounts: Dictionary mapping participant names to exact amounts
+
+        Returns:
+            Tuple of (cleaned exact amounts dictionary, sum of amounts)
+        """
+        exact_amounts_clean = {
+            canonical_name(name): exact_amount
+            for name, exact_amount in exact_amounts.items()
+        }
+        return exact_amounts_clean, sum(exact_amounts_clean.values())
+
     def compute_shares(
-        self, amount: float, participants: list[str], exact_amounts=None
-    ) -> dict:
+        self,
+        amount: float,
+        participants: list[str],
+        exact_amounts: Optional[dict[str, float]] = None,
+    ) -> dict[str, float]:
         """
         Compute shares using exact amounts that must sum to the total.
 
@@ -256,24 +474,16 @@ class ExactSplit(Split):
         Raises:
             ValueError: If amounts are missing or don't sum to the total
         """
-        exact_amounts = (
-            exact_amounts if exact_amounts is not None else self.exact_amounts
-        )
-
-        if not exact_amounts:
-            raise ValueError("Exact amounts must be provided for all participants.")
-
-        # Clean and normalize amount keys
-        exact_amounts_clean = {
-            name.strip().lower(): exact_amounts[name] for name in exact_amounts.keys()
-        }
+        if exact_amounts is None:
+            exact_amounts_clean, total = self._exact_amounts_clean, self._exact_total
+        else:
+            exact_amounts_clean, total = self._clean_exact_amounts(exact_amounts)
 
         # Check that all participants have exact amounts
-        if set(exact_amounts_clean.keys()) != set(participants):
+        if not exact_amounts_clean or exact_amounts_clean.keys() != set(participants):
             raise ValueError("Exact amounts must be provided for all participants.")
 
         # Validate that amounts sum to the total (with rounding tolerance)
-        total = sum(exact_amounts_clean[p] for p in participants)
         if round(total, ROUNDING_PRECISION) != round(amount, ROUNDING_PRECISION):
             raise ValueError("Exact amounts must sum to the total amount.")
 
@@ -187,21 +187,22 @@ class TestIntegration:
 
         ledger.balances()
 
-        # 10/3 = 3.3333... for each person (preserves precision)
-        for person in ledger.people.values():
-            assert person.owe == 10.0 / 3
+        # 10.00 / 3 is split in whole cents: the leftover cent goes to the
+        # first participant so the shares sum exactly to the total
+        assert ledger.people["alice"].owe == 3.34
+        assert ledger.people["bob"].owe == 3.33
+        assert ledger.people["charlie"].owe == 3.33
 
-        # Alice: paid 10, owes 3.33, balance = 6.67
+        # Alice: paid 10, owes 3.34, balance = 6.66
         # Bob: paid 0, owes 3.33, balance = -3.33
         # Charlie: paid 0, owes 3.33, balance = -3.33
 
-        assert ledger.people["alice"].balance == 6.67
+        assert ledger.people["alice"].balance == 6.66
         assert ledger.people["bob"].balance == -3.33
         assert ledger.people["charlie"].balance == -3.33
 
-        # Total should still be conserved despite rounding
-        total = sum(p.balance for p in ledger.people.values())
-        assert abs(total - 0.01) < 0.01  # Small rounding error acceptable
+        # Total is conserved exactly, with no rounding residue
+        assert sum(p.balance_cents for p in ledger.people.values()) == 0
 
     @patch("builtins.input", side_effect=["y", "y"])  # Auto-create missing people
     def test_auto_creation_workflow(self, mock_input):
@@ -242,15 +243,14 @@ class TestIntegration:
 
         ledger.balances()
 
-        # With precision-first approach:
+        # With cent-exact shares:
         # Expense 1: 85.50 / 2 = 42.75 each
-        # Expense 2: 92.75 / 2 = 46.375 each (no intermediate rounding)
-        # Total owed per person: 42.75 + 46.375 = 89.125
-        # Alice: paid 85.50, owes 89.125, balance = -3.625 -> -3.62 (rounded at settlement)
-        # Bob: paid 92.75, owes 89.125, balance = 3.625 -> 3.62 (rounded at settlement)
+        # Expense 2: 92.75 / 2 = 46.38 (Alice, gets the odd cent) + 46.37 (Bob)
+        # Alice: paid 85.50, owes 89.13, balance = -3.63
+        # Bob: paid 92.75, owes 89.12, balance = 3.63
 
-        assert ledger.people["alice"].balance == -3.62
-        assert ledger.people["bob"].balance == 3.62
+        assert ledger.people["alice"].balance == -3.63
+        assert ledger.people["bob"].balance == 3.63
 
     def test_stress_test_many_expenses(self):
         """Stress test with many small expenses."""
@@ -182,6 +182,104 @@ class TestLedger:
         # Should reset to 50, not add to 999
         assert ledger.people["alice"].owe == 50.0
 
+    def test_balances_incremental_after_recompute(self):
+        """Test that expenses added after balances() update owed amounts."""
+        ledger = Ledger()
+        ledger.add_person("alice", owe=999.0)
+        ledger.add_person("bob")
+
+        ledger.add_expense("alice", 100.0, ["alice", "bob"], "equal")
+        ledger.balances()
+        ledger.add_expense("bob", 60.0, ["alice", "bob"], "equal")
+
+        # Owed amounts are updated without waiting for another full recompute
+        assert ledger.people["alice"].owe == 80.0
+        assert ledger.people["bob"].owe == 80.0
+
+        ledger.balances()
+        assert ledger.people["alice"].balance == 20.0
+        assert ledger.people["bob"].balance == -20.0
+
+    def test_total_balance_tracks_updates(self):
+        """Test that total_balance matches paid minus owed across people."""
+        ledger = Ledger()
+        ledger.add_person("alice", paid=20.0)
+        ledger.add_person("bob", owe=5.0)
+        ledger.add_person("charlie")
+        assert ledger.total_balance == 15.0
+
+        ledger.add_expense("alice", 10.0, ["alice", "bob", "charlie"], "equal")
+        ledger.balances()
+        ledger.add_expense("bob", 7.5, ["alice", "bob"], "equal")
+
+        expected = sum(p.paid - p.owe for p in ledger.people.values())
+        assert ledger.total_balance == pytest.approx(expected)
+        assert ledger.total_balance == 20.0
+
+    def test_total_balance_same_after_full_recompute(self):
+        """Test that incremental and full recompute paths agree on total_balance."""
+        ledger = Ledger()
+        for name in ("a", "b", "c"):
+            ledger.add_person(name)
+        percentages = {"a": 33.336, "b": 33.336, "c": 33.336}
+        ledger.add_expense(
+            "a", 200.0, ["a", "b", "c"], "percent", percentages=percentages
+        )
+        ledger.balances()
+        incremental = ledger.total_balance
+
+        ledger.invalidate()
+        ledger.balances()
+        assert ledger.total_balance == incremental == 0
+
+    def test_balances_recompute_after_split_change(self):
+        """Test that a full recompute picks up reassigned split parameters."""
+        ledger = Ledger()
+        ledger.add_person("a")
+        ledger.add_person("b")
+        ledger.add_expense("a", 100.0, ["a", "b"], "weights", weights={"a": 1, "b": 1})
+        ledger.balances()
+        assert ledger.people["b"].owe == 50.0
+
+        ledger.expenses[0].split.weights = {"a": 3, "b": 1}
+        ledger.invalidate()
+        ledger.balances()
+        assert ledger.people["a"].owe == 75.0
+        assert ledger.people["b"].owe == 25.0
+
+    def test_total_expenses_tracks_additions(self):
+        """Test that total_expenses is kept in step with recorded expenses."""
+        ledger = Ledger()
+        ledger.add_person("alice")
+        ledger.add_person("bob")
+        assert ledger.total_expenses == 0
+
+        ledger.add_expense("alice", 0.1, ["alice", "bob"], "equal")
+        ledger.add_expense("bob", 0.2, ["alice", "bob"], "equal")
+        assert ledger.total_expenses == 0.3
+
+        with pytest.raises(ValueError):
+            ledger.add_expense("alice", 10.0, ["alice", "bob"], "percent")
+        assert ledger.total_expenses == 0.3
+
+    def test_add_expense_invalid_split_not_recorded(self):
+        """Test that an expense with invalid split parameters is rejected."""
+        ledger = Ledger()
+        ledger.add_person("alice")
+        ledger.add_person("bob")
+
+        with pytest.raises(ValueError, match="Percentages must sum to 100%"):
+            ledger.add_expense(
+                "alice",
+                100.0,
+                ["alice", "bob"],
+                "percent",
+                percentages={"alice": 60, "bob": 30},
+            )
+
+        assert ledger.expenses == []
+        assert ledger.people["alice"].paid == 0
+
     def test_settle_simple(self):
         """Test simple settlement between two people."""
         ledger = Ledger()
@@ -212,6 +310,53 @@ class TestLedger:
         assert len(lines) == 2  # Should be exactly 2 transfers
         assert "→" in output  # Should contain transfer arrows
 
+    def test_settle_uses_zero_sum_groups(self):
+        """Test that independent zero-sum groups are settled separately."""
+        ledger = Ledger()
+        ledger.add_person("alice", balance=4.0)
+        ledger.add_person("bob", balance=3.0)
+        ledger.add_person("charlie", balance=-3.0)
+        ledger.add_person("diana", balance=-2.0)
+        ledger.add_person("eve", balance=-2.0)
+
+        with patch("sys.stdout", new=StringIO()) as fake_output:
+            ledger.settle()
+            output = fake_output.getvalue()
+
+        # Greedy matching alone needs 4 transfers; grouping needs only 3
+        lines = output.strip().split("\n")
+        assert len(lines) == 3
+        assert "Charlie → Bob: 3.00£" in lines
+        assert all(person.balance == 0 for person in ledger.people.values())
+
+    def test_settle_pairs_opposite_balances(self):
+        """Test that exactly opposite balances settle in one transfer each."""
+        ledger = Ledger()
+        balances = {
+            "alice": 4.0,
+            "bob": 3.0,
+            "charlie": -3.0,
+            "diana": -2.0,
+            "eve": -2.0,
+            "frank": 10.0,
+            "grace": -10.0,
+            "heidi": 20.0,
+            "ivan": -20.0,
+        }
+        for name, balance in balances.items():
+            ledger.add_person(name, balance=balance)
+
+        with patch("sys.stdout", new=StringIO()) as fake_output:
+            ledger.settle()
+            output = fake_output.getvalue()
+
+        # Three exact pairs, then two transfers for alice, diana and eve
+        lines = output.strip().split("\n")
+        assert len(lines) == 5
+        assert "Grace → Frank: 10.00£" in lines
+        assert "Ivan → Heidi: 20.00£" in lines
+        assert all(person.balance == 0 for person in ledger.people.values())
+
     def test_settle_no_imbalance(self):
         """Test settlement when everyone has zero balance."""
         ledger = Ledger()
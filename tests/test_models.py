@@ -2,12 +2,28 @@
 Test module for models.py - tests Person and Expense classes
 """
 
+import copy
+import pickle
+import sys
+
 import pytest
 
 from models import Person, Expense, is_valid_money
 from split_strategies import EqualSplit, WeightsSplit, PercentSplit, ExactSplit
 
 
+@pytest.fixture(scope="module")
+def base_person():
+    """Shared Person for tests that only read it or expect a rejected update."""
+    return Person("test")
+
+
+@pytest.fixture(scope="module")
+def base_expense():
+    """Shared Expense for tests that only read it or expect a rejected update."""
+    return Expense("john", 100.0, ["john", "jane"], "equal")
+
+
 class TestPerson:
     """Test cases for the Person class."""
 
@@ -32,11 +48,16 @@ class TestPerson:
         with pytest.raises(ValueError, match="Missing name"):
             Person("")
 
-    def test_person_balance_validation_invalid_money(self):
+    def test_person_name_invalid_characters(self):
+        """Test that names outside the allowed character set are rejected."""
+        with pytest.raises(ValueError, match="invalid characters"):
+            Person("bob!")
+        assert Person("mary-jane o.k").name == "mary-jane o.k"
+
+    def test_person_balance_validation_invalid_money(self, base_person):
         """Test balance validation with invalid monetary values."""
-        person = Person("test")
         with pytest.raises(ValueError, match="Balance not valid monetary amount"):
-            person.balance = 10.123  # More than 2 decimal places
+            base_person.balance = 10.123  # More than 2 decimal places
 
     def test_person_balance_validation_valid_money(self):
         """Test balance validation with valid monetary values."""
@@ -50,6 +71,19 @@ class TestPerson:
         person.balance = 20.5  # 1 decimal place
         assert person.balance == 20.5
 
+    def test_person_huge_balance(self):
+        """Test that a balance too large to scale to cents is still stored."""
+        person = Person("x", balance=1e307)
+        assert person.balance == 1e307
+
+    def test_person_display_name(self):
+        """Test that the capitalized display name tracks the name."""
+        person = Person("  ALICE ")
+        assert person.display_name == "Alice"
+
+        person.name = "bob"
+        assert person.display_name == "Bob"
+
     def test_person_str_representation(self):
         """Test string representation of Person."""
         person = Person("alice", balance=25.50)
@@ -59,67 +93,90 @@ class TestPerson:
 class TestExpense:
     """Test cases for the Expense class."""
 
-    def test_expense_creation_equal_split(self):
-        """Test creating an expense with equal split."""
-        expense = Expense("john", 100.0, ["john", "jane"], "equal")
+    @pytest.mark.parametrize(
+        "method,split_class,split_kwargs",
+        [
+            ("equal", EqualSplit, {}),
+            ("weights", WeightsSplit, {"weights": {"john": 2, "jane": 1}}),
+            ("percent", PercentSplit, {"percentages": {"john": 60, "jane": 40}}),
+            ("exact", ExactSplit, {"exact_amounts": {"john": 75.0, "jane": 25.0}}),
+        ],
+    )
+    def test_expense_creation(self, method, split_class, split_kwargs):
+        """Test creating an expense with each split method."""
+        expense = Expense("john", 100.0, ["john", "jane"], method, **split_kwargs)
         assert expense.payer == "john"
         assert expense.amount == 100.0
         assert expense.participants == ["john", "jane"]
-        assert isinstance(expense.split, EqualSplit)
-
-    def test_expense_creation_weights_split(self):
-        """Test creating an expense with weights split."""
-        weights = {"john": 2, "jane": 1}
-        expense = Expense("john", 150.0, ["john", "jane"], "weights", weights=weights)
-        assert isinstance(expense.split, WeightsSplit)
-        assert expense.split.weights == weights
-
-    def test_expense_creation_percent_split(self):
-        """Test creating an expense with percent split."""
-        percentages = {"john": 60, "jane": 40}
-        expense = Expense(
-            "john", 200.0, ["john", "jane"], "percent", percentages=percentages
-        )
-        assert isinstance(expense.split, PercentSplit)
-        assert expense.split.percentages == percentages
-
-    def test_expense_creation_exact_split(self):
-        """Test creating an expense with exact split."""
-        exact_amounts = {"john": 75.0, "jane": 25.0}
-        expense = Expense(
-            "john", 100.0, ["john", "jane"], "exact", exact_amounts=exact_amounts
-        )
-        assert isinstance(expense.split, ExactSplit)
-        assert expense.split.exact_amounts == exact_amounts
+        assert isinstance(expense.split, split_class)
+        for name, value in split_kwargs.items():
+            assert getattr(expense.split, name) == value
 
     def test_expense_invalid_split_type(self):
         """Test creating an expense with invalid split type."""
         with pytest.raises(ValueError, match="Split method not valid"):
             Expense("john", 100.0, ["john", "jane"], "invalid")
 
-    def test_expense_payer_validation(self):
+    def test_expense_payer_validation(self, base_expense):
         """Test payer validation in Expense."""
-        expense = Expense("john", 100.0, ["john", "jane"], "equal")
         with pytest.raises(ValueError, match="Missing payer"):
-            expense.payer = ""
+            base_expense.payer = ""
 
-    def test_expense_amount_validation_negative(self):
+    def test_expense_amount_validation_negative(self, base_expense):
         """Test amount validation with negative values."""
-        expense = Expense("john", 100.0, ["john", "jane"], "equal")
         with pytest.raises(ValueError, match="Expense must be positive"):
-            expense.amount = -50.0
+            base_expense.amount = -50.0
 
-    def test_expense_amount_validation_invalid_money(self):
+    def test_expense_amount_validation_invalid_money(self, base_expense):
         """Test amount validation with invalid monetary values."""
-        expense = Expense("john", 100.0, ["john", "jane"], "equal")
         with pytest.raises(ValueError, match="Expense not valid monetary amount"):
-            expense.amount = 10.123  # More than 2 decimal places
+            base_expense.amount = 10.123  # More than 2 decimal places
 
-    def test_expense_participants_validation(self):
+    def test_expense_amount_validation_huge(self, base_expense):
+        """Test that huge amounts hit the MAX_AMOUNT check, not an overflow."""
+        with pytest.raises(ValueError, match="Expense cannot exceed"):
+            base_expense.amount = 1e308
+
+    def test_expense_participants_validation(self, base_expense):
         """Test participants validation in Expense."""
-        expense = Expense("john", 100.0, ["john", "jane"], "equal")
         with pytest.raises(ValueError, match="Missing participants"):
-            expense.participants = []
+            base_expense.participants = []
+
+    def test_expense_shares_cached_and_invalidated(self):
+        """Test that shares are cached and recomputed after reassignment."""
+        expense = Expense("john", 100.0, ["john", "jane"], "equal")
+        assert expense.shares == {"john": 5000, "jane": 5000}
+        assert expense.shares is expense.shares
+
+        expense.amount = 10.01
+        assert expense.shares == {"john": 501, "jane": 500}
+
+        expense.participants = ["john"]
+        assert expense.shares == {"john": 1001}
+
+    def test_expense_shares_follow_split_parameters(self):
+        """Test that reassigning the split's parameters refreshes cached shares."""
+        expense = Expense("a", 100.0, ["a", "b"], "weights", weights={"a": 1, "b": 1})
+        assert expense.shares == {"a": 5000, "b": 5000}
+
+        expense.split.weights = {"a": 3, "b": 1}
+        assert expense.shares == {"a": 7500, "b": 2500}
+
+    @pytest.mark.parametrize(
+        "method,split_kwargs",
+        [
+            ("weights", {"weights": {"john": 2, "jane": 1}}),
+            ("percent", {"percentages": {"john": 60, "jane": 40}}),
+            ("exact", {"exact_amounts": {"john": 75.0, "jane": 25.0}}),
+        ],
+    )
+    def test_expense_pickle_and_deepcopy(self, method, split_kwargs):
+        """Test that expenses with parameterised splits pickle and deep-copy."""
+        expense = Expense("john", 100.0, ["john", "jane"], method, **split_kwargs)
+        for clone in (pickle.loads(pickle.dumps(expense)), copy.deepcopy(expense)):
+            assert clone.shares == expense.shares
+            name, value = next(iter(split_kwargs.items()))
+            assert getattr(clone.split, name) == value
 
     def test_expense_str_representation(self):
         """Test string representation of Expense."""
@@ -131,35 +188,46 @@ class TestExpense:
 class TestIsValidMoney:
     """Test cases for the is_valid_money function."""
 
-    def test_valid_money_integers(self):
-        """Test valid money with integers."""
-        assert is_valid_money(100)
-        assert is_valid_money(0)
-        assert is_valid_money(-50)
-
-    def test_valid_money_floats_one_decimal(self):
-        """Test valid money with one decimal place."""
-        assert is_valid_money(10.5)
-        assert is_valid_money(99.9)
-
-    def test_valid_money_floats_two_decimals(self):
-        """Test valid money with two decimal places."""
-        assert is_valid_money(10.99)
-        assert is_valid_money(0.01)
-        assert is_valid_money(999.99)
-
-    def test_invalid_money_more_than_two_decimals(self):
-        """Test invalid money with more than two decimal places."""
-        assert not is_valid_money(10.123)
-        assert not is_valid_money(99.9999)
-
-    def test_invalid_money_non_numeric(self):
-        """Test invalid money with non-numeric types."""
-        assert not is_valid_money("100")
-        assert not is_valid_money(None)
-        assert not is_valid_money([100])
-        assert not is_valid_money({"amount": 100})
+    @pytest.mark.parametrize(
+        "value",
+        [
+            100,
+            0,
+            -50,
+            10.5,
+            99.9,
+            10.99,
+            0.01,
+            999.99,
+            0.1 + 0.2,  # Binary float noise is not an extra decimal place
+            1.1 * 3,
+            19.99 + 0.01,
+            1e307,  # Scaling to cents would overflow
+            sys.float_info.max,
+        ],
+    )
+    def test_valid_money(self, value):
+        """Test valid money: integers and floats with up to two decimals."""
+        assert is_valid_money(value)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            10.123,
+            99.9999,
+            "100",
+            None,
+            [100],
+            {"amount": 100},
+            float("nan"),
+            float("inf"),
+            True,
+        ],
+    )
+    def test_invalid_money(self, value):
+        """Test invalid money: extra decimals, non-numeric, non-finite, bool."""
+        assert not is_valid_money(value)
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
+    pytest.main([__file__, "-p", "no:cacheprovider"])
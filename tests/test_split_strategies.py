@@ -22,19 +22,22 @@ class TestSplit:
 class TestEqualSplit:
     """Test cases for the EqualSplit class."""
 
-    def test_equal_split_two_participants(self):
-        """Test equal split with two participants."""
+    @pytest.mark.parametrize(
+        "amount,participants,expected",
+        [
+            (100.0, ["alice", "bob"], {"alice": 50.0, "bob": 50.0}),
+            (
+                99.0,
+                ["alice", "bob", "charlie"],
+                {"alice": 33.0, "bob": 33.0, "charlie": 33.0},
+            ),
+            (100.0, ["alice"], {"alice": 100.0}),
+        ],
+    )
+    def test_equal_split(self, amount, participants, expected):
+        """Test equal split with two, three and a single participant."""
         split = EqualSplit()
-        result = split.compute_shares(100.0, ["alice", "bob"])
-        expected = {"alice": 50.0, "bob": 50.0}
-        assert result == expected
-
-    def test_equal_split_three_participants(self):
-        """Test equal split with three participants."""
-        split = EqualSplit()
-        result = split.compute_shares(99.0, ["alice", "bob", "charlie"])
-        expected = {"alice": 33.0, "bob": 33.0, "charlie": 33.0}
-        assert result == expected
+        assert split.compute_shares(amount, participants) == expected
 
     def test_equal_split_odd_amount(self):
         """Test equal split with odd amount that doesn't divide evenly."""
@@ -43,12 +46,12 @@ class TestEqualSplit:
         expected = {"alice": 10.0 / 3, "bob": 10.0 / 3, "charlie": 10.0 / 3}
         assert result == expected
 
-    def test_equal_split_single_participant(self):
-        """Test equal split with single participant."""
+    def test_equal_split_cents_remainder(self):
+        """Test that leftover cents go to the first participants."""
         split = EqualSplit()
-        result = split.compute_shares(100.0, ["alice"])
-        expected = {"alice": 100.0}
-        assert result == expected
+        result = split.compute_cents(1000, ["alice", "bob", "charlie"])
+        assert result == {"alice": 334, "bob": 333, "charlie": 333}
+        assert sum(result.values()) == 1000
 
     def test_equal_split_str_representation(self):
         """Test string representation of EqualSplit."""
@@ -70,21 +73,21 @@ class TestWeightsSplit:
         split = WeightsSplit()
         assert split.weights == {}
 
-    def test_weights_split_basic(self):
-        """Test basic weights split calculation."""
-        weights = {"alice": 2, "bob": 1}
-        split = WeightsSplit(weights)
-        result = split.compute_shares(90.0, ["alice", "bob"])
-        expected = {"alice": 60.0, "bob": 30.0}  # 2:1 ratio
-        assert result == expected
-
-    def test_weights_split_three_participants(self):
-        """Test weights split with three participants."""
-        weights = {"alice": 3, "bob": 2, "charlie": 1}
+    @pytest.mark.parametrize(
+        "weights,amount,expected",
+        [
+            ({"alice": 2, "bob": 1}, 90.0, {"alice": 60.0, "bob": 30.0}),
+            (
+                {"alice": 3, "bob": 2, "charlie": 1},
+                120.0,
+                {"alice": 60.0, "bob": 40.0, "charlie": 20.0},
+            ),
+        ],
+    )
+    def test_weights_split(self, weights, amount, expected):
+        """Test weights split in 2:1 and 3:2:1 ratios."""
         split = WeightsSplit(weights)
-        result = split.compute_shares(120.0, ["alice", "bob", "charlie"])
-        expected = {"alice": 60.0, "bob": 40.0, "charlie": 20.0}  # 3:2:1 ratio
-        assert result == expected
+        assert split.compute_shares(amount, list(weights)) == expected
 
     def test_weights_split_passed_weights(self):
         """Test weights split with weights passed to compute_shares."""
@@ -104,11 +107,30 @@ class TestWeightsSplit:
             split.compute_shares(100.0, ["alice", "bob"])
 
     def test_weights_split_zero_total_weight(self):
-        """Test weights split with zero total weight."""
+        """Test weights split with zero total weight (rejected on construction)."""
         weights = {"alice": 0, "bob": 0}
-        split = WeightsSplit(weights)
         with pytest.raises(ValueError, match="Total weight must be greater than zero"):
-            split.compute_shares(100.0, ["alice", "bob"])
+            WeightsSplit(weights)
+
+    def test_weights_split_passed_weights_validated(self):
+        """Test that weights passed to compute_shares are validated per call."""
+        split = WeightsSplit({"alice": 1, "bob": 1})
+        with pytest.raises(ValueError, match="Weight for bob cannot be negative"):
+            split.compute_shares(
+                100.0, ["alice", "bob"], weights={"alice": 1, "bob": -1}
+            )
+
+    def test_weights_split_weights_read_only(self):
+        """Test that in-place edits fail loudly and reassignment revalidates."""
+        split = WeightsSplit({"alice": 1})
+        with pytest.raises(TypeError):
+            split.weights["bob"] = 1
+
+        split.weights = {**split.weights, "bob": 1}
+        assert split.compute_shares(10.0, ["alice", "bob"]) == {
+            "alice": 5.0,
+            "bob": 5.0,
+        }
 
     def test_weights_split_key_cleaning(self):
         """Test weights split with key cleaning (capitalized keys)."""
@@ -118,6 +140,12 @@ class TestWeightsSplit:
         expected = {"alice": 60.0, "bob": 30.0}
         assert result == expected
 
+    def test_weights_split_cents_sum_exactly(self):
+        """Test that weighted cent shares always sum to the total."""
+        split = WeightsSplit({"alice": 1, "bob": 1, "charlie": 1})
+        result = split.compute_cents(100, ["alice", "bob", "charlie"])
+        assert result == {"alice": 34, "bob": 33, "charlie": 33}
+
     def test_weights_split_str_representation(self):
         """Test string representation of WeightsSplit."""
         split = WeightsSplit()
@@ -138,21 +166,21 @@ class TestPercentSplit:
         split = PercentSplit()
         assert split.percentages == {}
 
-    def test_percent_split_basic(self):
-        """Test basic percent split calculation."""
-        percentages = {"alice": 60, "bob": 40}
+    @pytest.mark.parametrize(
+        "percentages,amount,expected",
+        [
+            ({"alice": 60, "bob": 40}, 100.0, {"alice": 60.0, "bob": 40.0}),
+            (
+                {"alice": 50, "bob": 30, "charlie": 20},
+                200.0,
+                {"alice": 100.0, "bob": 60.0, "charlie": 40.0},
+            ),
+        ],
+    )
+    def test_percent_split(self, percentages, amount, expected):
+        """Test percent split with two and three participants."""
         split = PercentSplit(percentages)
-        result = split.compute_shares(100.0, ["alice", "bob"])
-        expected = {"alice": 60.0, "bob": 40.0}
-        assert result == expected
-
-    def test_percent_split_three_participants(self):
-        """Test percent split with three participants."""
-        percentages = {"alice": 50, "bob": 30, "charlie": 20}
-        split = PercentSplit(percentages)
-        result = split.compute_shares(200.0, ["alice", "bob", "charlie"])
-        expected = {"alice": 100.0, "bob": 60.0, "charlie": 40.0}
-        assert result == expected
+        assert split.compute_shares(amount, list(percentages)) == expected
 
     def test_percent_split_passed_percentages(self):
         """Test percent split with percentages passed to compute_shares."""
@@ -172,11 +200,21 @@ class TestPercentSplit:
             split.compute_shares(100.0, ["alice", "bob"])
 
     def test_percent_split_not_100_percent(self):
-        """Test percent split with percentages not summing to 100."""
+        """Test percent split with percentages not summing to 100 (rejected on construction)."""
         percentages = {"alice": 60, "bob": 30}  # Sum is 90, not 100
-        split = PercentSplit(percentages)
         with pytest.raises(ValueError, match="Percentages must sum to 100%"):
-            split.compute_shares(100.0, ["alice", "bob"])
+            PercentSplit(percentages)
+
+    def test_percent_split_cents_within_tolerance(self):
+        """Test cent shares sum to the total for percentages off by tolerance."""
+        split = PercentSplit({"a": 33.336, "b": 33.336, "c": 33.336})
+        result = split.compute_cents(20000, ["a", "b", "c"])
+        assert sum(result.values()) == 20000
+        assert result == {"a": 6667, "b": 6667, "c": 6666}
+
+        split = PercentSplit({"a": 49.995, "b": 50})
+        result = split.compute_cents(99999999, ["a", "b"])
+        assert sum(result.values()) == 99999999
 
     def test_percent_split_key_cleaning(self):
         """Test percent split with key cleaning (capitalized keys)."""
@@ -206,21 +244,18 @@ class TestExactSplit:
         split = ExactSplit()
         assert split.exact_amounts == {}
 
-    def test_exact_split_basic(self):
-        """Test basic exact split calculation."""
-        exact_amounts = {"alice": 60.0, "bob": 40.0}
+    @pytest.mark.parametrize(
+        "exact_amounts",
+        [
+            {"alice": 60.0, "bob": 40.0},
+            {"alice": 50.0, "bob": 30.0, "charlie": 20.0},
+        ],
+    )
+    def test_exact_split(self, exact_amounts):
+        """Test exact split with two and three participants."""
         split = ExactSplit(exact_amounts)
-        result = split.compute_shares(100.0, ["alice", "bob"])
-        expected = {"alice": 60.0, "bob": 40.0}
-        assert result == expected
-
-    def test_exact_split_three_participants(self):
-        """Test exact split with three participants."""
-        exact_amounts = {"alice": 50.0, "bob": 30.0, "charlie": 20.0}
-        split = ExactSplit(exact_amounts)
-        result = split.compute_shares(100.0, ["alice", "bob", "charlie"])
-        expected = {"alice": 50.0, "bob": 30.0, "charlie": 20.0}
-        assert result == expected
+        result = split.compute_shares(100.0, list(exact_amounts))
+        assert result == exact_amounts
 
     def test_exact_split_passed_amounts(self):
         """Test exact split with amounts passed to compute_shares."""
@@ -270,6 +305,13 @@ class TestExactSplit:
         }  # Preserves exact precision until settlement
         assert result == expected
 
+    def test_exact_split_cents_largest_remainder(self):
+        """Test that sub-cent exact amounts are apportioned by largest remainder."""
+        exact_amounts = {"alice": 33.333, "bob": 33.333, "charlie": 33.334}
+        split = ExactSplit(exact_amounts)
+        result = split.compute_cents(10000, ["alice", "bob", "charlie"])
+        assert result == {"alice": 3333, "bob": 3333, "charlie": 3334}
+
     def test_exact_split_str_representation(self):
         """Test string representation of ExactSplit."""
         split = ExactSplit()
@@ -277,4 +319,4 @@ class TestExactSplit:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
+    pytest.main([__file__, "-p", "no:cacheprovider"])
@@ -0,0 +1,86 @@
+"""
+Test module for utils.py - tests formatting and input parsing helpers
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from utils import format_currency, has_valid_name_chars, parse_amount_input
+
+
+class TestFormatCurrency:
+    """Test cases for the format_currency function."""
+
+    def test_format_currency_default_symbol(self):
+        """Test formatting with the default currency symbol."""
+        assert format_currency(10.5) == "£10.50"
+        assert format_currency(3) == "£3.00"
+
+    def test_format_currency_custom_symbol(self):
+        """Test formatting with a different currency symbol."""
+        assert format_currency(10.5, "$") == "$10.50"
+
+    def test_format_currency_decimal(self):
+        """Test that non-float numerics such as Decimal still format."""
+        assert format_currency(Decimal("1.50")) == "£1.50"
+        assert format_currency(Decimal("-0"), "$") == "$0.00"
+
+    def test_format_currency_signed_zero(self):
+        """Test that zero and negative zero format the same in either order."""
+        assert format_currency(-0.0) == "£0.00"
+        assert format_currency(0.0) == "£0.00"
+        assert format_currency(-0.0, "$") == format_currency(0.0, "$") == "$0.00"
+
+
+class TestHasValidNameChars:
+    """Test cases for the has_valid_name_chars function."""
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("mary-jane o.k_2", True),
+            ("bob!", False),
+            ("zoë", False),
+            ("", False),
+        ],
+    )
+    def test_has_valid_name_chars(self, name, expected):
+        """Test allowed characters, rejected characters and the empty name."""
+        assert has_valid_name_chars(name) is expected
+
+
+class TestParseAmountInput:
+    """Test cases for the parse_amount_input function."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("10.50", 10.5),
+            ("£10.50", 10.5),
+            ("$ 7", 7.0),
+            ("1_000", 1000.0),
+            ("1e3", 1000.0),
+            ("\uff11\uff12", 12.0),  # Full-width digits
+        ],
+    )
+    def test_parse_amount_valid(self, text, expected):
+        """Test that plain, symbol-prefixed and separator amounts parse."""
+        assert parse_amount_input(text) == (True, expected, "")
+
+    @pytest.mark.parametrize("text", ["nan", "inf", "-inf", "abc", "", "£", "1.2.3"])
+    def test_parse_amount_invalid_format(self, text):
+        """Test that non-numeric and non-finite input is rejected."""
+        assert parse_amount_input(text) == (False, 0.0, "Invalid amount format")
+
+    def test_parse_amount_rejections(self):
+        """Test the non-positive, too-large and too-precise error messages."""
+        assert parse_amount_input("-5")[2] == "Amount must be positive"
+        assert parse_amount_input("1000000")[2].startswith("Amount too large")
+        assert parse_amount_input("10.123")[2] == (
+            "Amount cannot have more than 2 decimal places"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
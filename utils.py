@@ -5,15 +5,66 @@ This module provides common validation, formatting, and input parsing
 functions used throughout the application.
 """
 
+import math
 import re
+import string
+import sys
+from functools import lru_cache
 from constants import (
     MAX_NAME_LENGTH,
     NAME_PATTERN,
     MAX_AMOUNT,
     DEFAULT_CURRENCY_SYMBOL,
     ROUNDING_PRECISION,
+    CENTS,
 )
 
+__all__ = [
+    "format_currency",
+    "to_cents",
+    "from_cents",
+    "canonical_name",
+    "has_valid_name_chars",
+    "clean_input",
+    "validate_name",
+    "parse_amount_input",
+    "is_valid_money",
+]
+
+# %-template for the default currency, the symbol nearly every call uses
+_DEFAULT_CURRENCY_TEMPLATE = f"{DEFAULT_CURRENCY_SYMBOL}%.{ROUNDING_PRECISION}f"
+
+# Compiled once so validation skips the re module cache lookup
+_NAME_RE = re.compile(NAME_PATTERN)
+
+# ASCII characters NAME_PATTERN accepts; names made only of these skip the regex
+_NAME_CHARS = frozenset(
+    string.ascii_letters + string.digits + string.whitespace + "-_."
+)
+
+# Translation table deleting common currency symbols in a single pass
+_CURRENCY_STRIP = str.maketrans("", "", "£$€")
+
+# ASCII characters float() accepts in a finite amount (digits, whitespace, sign,
+# decimal point, exponent and underscore separators)
+_AMOUNT_CHARS = frozenset(string.digits + string.whitespace + ".+-eE_")
+
+# Errors that depend only on constants, formatted once at import
+_NAME_TOO_LONG_DEFAULT = f"Name too long (max {MAX_NAME_LENGTH} characters)"
+_AMOUNT_TOO_LARGE = f"Amount too large (max {_DEFAULT_CURRENCY_TEMPLATE % MAX_AMOUNT})"
+_TOO_MANY_DECIMALS = f"Amount cannot have more than {ROUNDING_PRECISION} decimal places"
+
+
+@lru_cache(maxsize=512)
+def _format_currency(amount: float, currency_symbol: str) -> str:
+    """Format an amount, memoized since amounts recur in a session."""
+    # 0.0 and -0.0 share a cache key, so both must format as plain zero
+    if amount == 0:
+        amount = 0.0
+    if currency_symbol == DEFAULT_CURRENCY_SYMBOL:
+        return _DEFAULT_CURRENCY_TEMPLATE % amount
+    return f"{currency_symbol}{amount:.{ROUNDING_PRECISION}f}"
+
 
 def format_currency(
     amount: float, currency_symbol: str = DEFAULT_CURRENCY_SYMBOL
@@ -21,6 +72,9 @@ def format_currency(
     """
     Format a monetary amount with proper currency display.
 
+    Negative zero formats as plain zero, since the cache treats 0.0 and
+    -0.0 as the same key.
+
     Args:
         amount: The monetary amount to format
         currency_symbol: Currency symbol to use (default: £)
@@ -28,7 +82,60 @@ def format_currency(
     Returns:
         Formatted currency string (e.g., "£10.50")
     """
-    return f"{currency_symbol}{amount:.{ROUNDING_PRECISION}f}"
+    return _format_currency(amount, currency_symbol)
+
+
+def to_cents(amount: float) -> int:
+    """
+    Convert a monetary amount to a whole number of cents.
+
+    Args:
+        amount: The monetary amount (e.g., 10.5)
+
+    Returns:
+        Amount in cents, rounded to the nearest cent (e.g., 1050)
+    """
+    scaled = amount * CENTS
+    # Floats this large are whole numbers and would overflow when scaled
+    if not math.isfinite(scaled):
+        return round(amount) * CENTS
+    return round(scaled)
+
+
+def from_cents(cents: int) -> float:
+    """
+    Convert a whole number of cents back to a monetary amount.
+
+    Args:
+        cents: Amount in cents (e.g., 1050)
+
+    Returns:
+        The monetary amount as a float (e.g., 10.5)
+    """
+    return cents / CENTS
+
+
+def canonical_name(name: str) -> str:
+    """
+    Normalize a person's name to its canonical form.
+
+    The name is trimmed, lowercased and interned, so every ledger lookup
+    for the same person shares a single string object and dict key
+    comparisons short-circuit on identity.
+
+    Args:
+        name: Raw name string
+
+    Returns:
+        Canonical (trimmed, lowercased, interned) name
+    """
+    return sys.intern(name.strip().lower())
+
+
+@lru_cache(maxsize=2048)
+def _clean_str(text: str) -> str:
+    """Trim and lowercase a string, memoized for recurring names."""
+    return text.strip().lower()
 
 
 def clean_input(text: str) -> str:
@@ -41,9 +148,27 @@ def clean_input(text: str) -> str:
     Returns:
         Cleaned input (trimmed and lowercased)
     """
-    if not isinstance(text, str):
-        return ""
-    return text.strip().lower()
+    return _clean_str(text) if isinstance(text, str) else ""
+
+
+def has_valid_name_chars(name: str) -> bool:
+    """
+    Check that a name only uses characters allowed by NAME_PATTERN.
+
+    Names made solely of ASCII letters, digits, whitespace, hyphens,
+    underscores and dots are accepted by a set check; anything else falls
+    back to the compiled pattern. Like the pattern, an empty name is
+    rejected.
+
+    Args:
+        name: Stripped name to check
+
+    Returns:
+        True if the name is non-empty and every character is allowed
+    """
+    return bool(name) and (
+        _NAME_CHARS.issuperset(name) or _NAME_RE.match(name) is not None
+    )
 
 
 def validate_name(name: str, max_length: int = MAX_NAME_LENGTH) -> tuple[bool, str]:
@@ -66,9 +191,11 @@ def validate_name(name: str, max_length: int = MAX_NAME_LENGTH) -> tuple[bool, s
         return False, "Name cannot be empty"
 
     if len(cleaned_name) > max_length:
+        if max_length == MAX_NAME_LENGTH:
+            return False, _NAME_TOO_LONG_DEFAULT
         return False, f"Name too long (max {max_length} characters)"
 
-    if not re.match(NAME_PATTERN, cleaned_name):
+    if not has_valid_name_chars(cleaned_name):
         return (
             False,
             "Name contains invalid characters (use letters, numbers, spaces, hyphens, underscores, dots)",
@@ -91,7 +218,13 @@ def parse_amount_input(input_str: str) -> tuple[bool, float, str]:
         return False, 0.0, "Input must be a string"
 
     # Remove common currency symbols
-    cleaned = input_str.strip().replace("£", "").replace("$", "").replace("€", "")
+    cleaned = input_str.strip().translate(_CURRENCY_STRIP)
+
+    # Reject obvious non-numbers (including "nan"/"inf") without raising and
+    # catching a ValueError; non-ASCII input such as full-width digits is left
+    # to float()
+    if not cleaned or (cleaned.isascii() and not _AMOUNT_CHARS.issuperset(cleaned)):
+        return False, 0.0, "Invalid amount format"
 
     try:
         amount = float(cleaned)
@@ -100,15 +233,12 @@ def parse_amount_input(input_str: str) -> tuple[bool, float, str]:
             return False, 0.0, "Amount must be positive"
 
         if amount > MAX_AMOUNT:
-            return False, 0.0, f"Amount too large (max {format_currency(MAX_AMOUNT)})"
+            return False, 0.0, _AMOUNT_TOO_LARGE
 
         # Validate decimal places
-        if "." in cleaned and len(cleaned.split(".")[1]) > ROUNDING_PRECISION:
-            return (
-                False,
-                0.0,
-                f"Amount cannot have more than {ROUNDING_PRECISION} decimal places",
-            )
+        dot = cleaned.rfind(".")
+        if dot != -1 and len(cleaned) - dot - 1 > ROUNDING_PRECISION:
+            return False, 0.0, _TOO_MANY_DECIMALS
 
         return True, round(amount, ROUNDING_PRECISION), ""
 
@@ -129,21 +259,24 @@ def is_valid_money(value) -> bool:
     Returns:
         True if valid monetary amount, False otherwise
     """
-    if not isinstance(value, (int, float)):
+    # bool is an int subclass but never a monetary amount
+    if isinstance(value, bool):
         return False
 
-    # Check for infinite values
-    if not (float("-inf") < value < float("inf")):
-        return False
+    # Integers are always finite whole amounts
+    if isinstance(value, int):
+        return True
 
-    # Check for NaN
-    if value != value:  # NaN is not equal to itself
+    if not isinstance(value, float):
         return False
 
-    # Validate decimal places precision
-    value_str = f"{value:.10f}".rstrip("0").rstrip(".")
-    if "." in value_str:
-        decimals = value_str.split(".")[1]
-        return len(decimals) <= ROUNDING_PRECISION
+    # Check for infinite values and NaN
+    if not math.isfinite(value):
+        return False
 
-    return True
+    # Validate decimal places precision on the scaled value
+    scaled = value * CENTS
+    # Floats too large to scale have no fractional part at all
+    if not math.isfinite(scaled):
+        return True
+    return abs(scaled - round(scaled)) < 1e-6